@@ -1,25 +1,50 @@
 """FastAPI application for Pydantic AI agents with AG-UI protocol."""
 
+import asyncio
+import os
+from importlib import import_module
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-# Import all agents with proper error handling
-try:
-    # Try relative imports first (for when used as a package)
-    from .agents.simple_agentic_chat import app as agentic_chat_app
-    from .agents.tool_based_generative_ui import app as tool_based_generative_ui_app
-    from .agents.human_in_the_loop import app as human_in_the_loop_app
-    from .agents.shared_state import app as shared_state_app
-    from .agents.agentic_generative_ui import app as agentic_generative_ui_app
-    from .agents.predictive_state_updates import app as predictive_state_updates_app
-except ImportError:
-    # Fall back to absolute imports (for when run directly)
-    from agents.simple_agentic_chat import app as agentic_chat_app
-    from agents.tool_based_generative_ui import app as tool_based_generative_ui_app
-    from agents.human_in_the_loop import app as human_in_the_loop_app
-    from agents.shared_state import app as shared_state_app
-    from agents.agentic_generative_ui import app as agentic_generative_ui_app
-    from agents.predictive_state_updates import app as predictive_state_updates_app
+# Agent mount prefixes mapped to the modules that provide their apps.
+# Imports are deferred until server startup so that importing this package
+# (tests, tooling, scripts) doesn't pull the full pydantic-ai/openai import
+# graph on cold start.
+_AGENT_MODULES = {
+    "/agentic_chat": "agents.simple_agentic_chat",
+    "/human_in_the_loop": "agents.human_in_the_loop",
+    "/agentic_generative_ui": "agents.agentic_generative_ui",
+    "/tool_based_generative_ui": "agents.tool_based_generative_ui",
+    "/shared_state": "agents.shared_state",
+    "/predictive_state_updates": "agents.predictive_state_updates",
+}
+
+class _ConcurrencyLimitMiddleware:
+    """ASGI middleware that caps concurrent in-flight agent requests.
+
+    Each agent request drives an LLM stream, so unbounded concurrency can
+    thrash the event loop under load. The semaphore is held for the full
+    response (including streaming), bounding concurrent agent runs. Only
+    the agent mounts are limited — /health and / must answer immediately
+    even when every agent slot is busy streaming, or liveness probes fail
+    exactly when the service is loaded but healthy.
+    Tune via the AGENT_CONCURRENCY env var.
+    """
+
+    _AGENT_PREFIXES = tuple(_AGENT_MODULES)
+
+    def __init__(self, app, limit: int):
+        self.app = app
+        self.semaphore = asyncio.Semaphore(limit)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self._AGENT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        async with self.semaphore:
+            await self.app(scope, receive, send)
+
 
 # Create main FastAPI app
 app = FastAPI(
@@ -28,6 +53,12 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Cap concurrent agent requests (outermost, so it also covers the mounts)
+app.add_middleware(
+    _ConcurrencyLimitMiddleware,
+    limit=int(os.getenv("AGENT_CONCURRENCY", "4")),
+)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -37,30 +68,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount agent apps
-app.mount("/agentic_chat", agentic_chat_app)
-app.mount("/human_in_the_loop", human_in_the_loop_app)
-app.mount("/agentic_generative_ui", agentic_generative_ui_app)
-app.mount("/tool_based_generative_ui", tool_based_generative_ui_app)
-app.mount("/shared_state", shared_state_app)
-app.mount("/predictive_state_updates", predictive_state_updates_app)
+_agents_mounted = False
+
+
+def _import_module(module_name: str):
+    """Import a service module, as a package member or standalone."""
+    if __package__:
+        try:
+            # Try relative imports first (for when used as a package)
+            return import_module(f".{module_name}", package=__package__)
+        except ImportError:
+            # Fall back to absolute imports (for when run directly)
+            return import_module(module_name)
+    return import_module(module_name)
+
+
+@app.on_event("startup")
+async def _mount_agents():
+    """Import and mount the agent apps on first server startup."""
+    global _agents_mounted
+    if _agents_mounted:
+        return
+    # Load .env exactly once for the whole process; the agent modules no
+    # longer do this themselves at import.
+    _import_module("agents._env").ensure_env()
+    for prefix, module_name in _AGENT_MODULES.items():
+        app.mount(prefix, _import_module(module_name).app)
+    _agents_mounted = True
+
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    """Close the shared httpx client if the agents ever built it."""
+    http = _import_module("agents._http")
+    if http.shared_http_client.cache_info().currsize:
+        await http.shared_http_client().aclose()
+
 
 @app.get("/")
 async def root():
     """Root endpoint."""
     return {
         "message": "Pydantic AI Agents API",
-        "agents": [
-            "/agentic_chat",
-            "/human_in_the_loop",
-            "/agentic_generative_ui",
-            "/tool_based_generative_ui",
-            "/shared_state",
-            "/predictive_state_updates"
-        ]
+        "agents": list(_AGENT_MODULES.keys())
     }
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
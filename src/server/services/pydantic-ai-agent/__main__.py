@@ -1,5 +1,7 @@
 """Entry point for running the Pydantic AI agents server."""
 
+import os
+
 import uvicorn
 from dotenv import load_dotenv
 
@@ -7,10 +9,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 if __name__ == "__main__":
+    # DEV=1 enables the autoreload file watcher (single process only);
+    # otherwise WORKERS processes serve in parallel (default: CPU count).
+    dev = os.getenv("DEV") == "1"
     uvicorn.run(
         "pydantic-ai-agent:app",
         host="0.0.0.0",
         port=9000,
-        reload=True,
+        reload=dev,
+        workers=1 if dev else int(os.getenv("WORKERS", os.cpu_count() or 1)),
         log_level="info"
     )
\ No newline at end of file
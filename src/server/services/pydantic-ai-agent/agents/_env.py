@@ -0,0 +1,19 @@
+"""One-time environment bootstrap shared by the agent modules."""
+
+import os
+import warnings
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def ensure_env():
+    """Load .env exactly once per process.
+
+    Every agent module used to run load_dotenv() (a filesystem walk plus a
+    full .env parse) at import time; the cache makes repeat callers a no-op.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    if not os.getenv('OPENROUTER_API_KEY'):
+        warnings.warn("OPENROUTER_API_KEY is not set; agent requests will fail")
@@ -0,0 +1,25 @@
+"""Shared HTTP client for the agent modules."""
+
+from functools import lru_cache
+from importlib.util import find_spec
+
+import httpx
+
+
+@lru_cache(maxsize=None)
+def shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide httpx client shared by all agents.
+
+    Without an explicit client each provider builds its own httpx pool, so
+    every agent pays its own TCP + TLS handshakes to the upstream API. One
+    client amortizes connection setup across agents, and HTTP/2 (enabled
+    when the optional h2 extra is installed) multiplexes concurrent agent
+    requests over a single connection.
+
+    The server shutdown hook closes this client; see the package __init__.
+    """
+    return httpx.AsyncClient(
+        http2=find_spec('h2') is not None,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=httpx.Timeout(60.0),
+    )
@@ -0,0 +1,59 @@
+"""Shared model construction for the agent modules."""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from pydantic_ai.providers.openrouter import OpenRouterProvider
+from pydantic_ai.settings import ModelSettings
+
+from ._http import shared_http_client
+
+
+@lru_cache(maxsize=None)
+def shared_model() -> OpenAIModel:
+    """Return the process-wide model instance shared by all agents.
+
+    Each agent previously passed its own provider-prefixed model string to
+    Agent(), which makes pydantic-ai build a separate OpenAIModel — and with
+    it a separate OpenAI client and httpx connection pool — per module.
+    Building the model once keeps a single client and pool across all six
+    agents.
+
+    Routing defaults to OpenRouter (the service's existing setup). Set
+    USE_OPENROUTER=0 to talk to OpenAI directly with OPENAI_API_KEY: the
+    gateway hop can defeat OpenAI's automatic prompt-prefix cache, and a
+    direct connection guarantees the static system prompts hit it.
+    """
+    model_name = os.getenv('OPENROUTER_MODEL', 'openai/gpt-4o-mini')
+    if os.getenv('USE_OPENROUTER', '1') == '1':
+        return OpenAIModel(
+            model_name,
+            provider=OpenRouterProvider(http_client=shared_http_client()),
+        )
+    # Strip the OpenRouter vendor prefix ('openai/gpt-4o-mini' -> 'gpt-4o-mini').
+    return OpenAIModel(
+        model_name.rpartition('/')[2],
+        provider=OpenAIProvider(http_client=shared_http_client()),
+    )
+
+
+@lru_cache(maxsize=None)
+def shared_model_settings() -> Optional[ModelSettings]:
+    """Return model settings enabling provider-side prompt caching.
+
+    OpenAI-family models cache static prompt prefixes automatically as long
+    as the system prompt is the byte-identical first message, which
+    pydantic-ai guarantees — no settings needed. Anthropic models routed
+    through OpenRouter need an explicit ephemeral cache_control marker plus
+    the prompt-caching beta header to get the same discount.
+    """
+    model_name = os.getenv('OPENROUTER_MODEL', 'openai/gpt-4o-mini')
+    if 'anthropic' in model_name or 'claude' in model_name:
+        return ModelSettings(
+            extra_headers={'anthropic-beta': 'prompt-caching-2024-07-31'},
+            extra_body={'cache_control': {'type': 'ephemeral'}},
+        )
+    return None
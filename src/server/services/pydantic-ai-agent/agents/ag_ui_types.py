@@ -1,7 +1,7 @@
 """Shared AG-UI types and base classes for Pydantic AI agents."""
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -14,26 +14,20 @@ class EventType(str, Enum):
 
 class ComponentModel(BaseModel):
     """Base class for AG-UI components."""
+    model_config = ConfigDict(extra="allow")
+
     type: str = Field(description="The component type")
-    
-    class Config:
-        extra = "allow"
 
 
 class AgentDeps(BaseModel):
     """Base class for agent dependencies."""
-    
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class StateDeps(BaseModel):
     """State dependencies wrapper for agents."""
-    
-    def __init__(self, state_type=None):
-        super().__init__()
-        self.state_type = state_type
-    
+    state_type: Optional[Any] = None
+
     def __class_getitem__(cls, item):
         """Support for generic type hints like StateDeps[MyState]."""
         return cls
@@ -41,10 +35,9 @@ class StateDeps(BaseModel):
 
 class BaseEvent(BaseModel):
     """Base class for AG-UI events."""
+    model_config = ConfigDict(extra="allow")
+
     type: EventType
-    
-    class Config:
-        extra = "allow"
 
 
 class InteractableEvent(BaseEvent):
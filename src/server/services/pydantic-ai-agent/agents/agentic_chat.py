@@ -3,23 +3,38 @@
 from __future__ import annotations
 
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from textwrap import dedent
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
 from pydantic import BaseModel
 
 from pydantic_ai import Agent
 
-# Create the agent
-agent = Agent(
-    model=os.getenv('OPENAI_MODEL', 'openai:gpt-4o-mini'),
-    system_prompt=dedent("""
+# Alias needed because the tool parameter below shadows the `timezone` name.
+_UTC = timezone.utc
+
+# Valid color names for set_background_color, frozen once at import so the
+# tool does an O(1) membership check instead of rebuilding a list per call.
+_VALID_COLORS = frozenset({
+    'red', 'blue', 'green', 'yellow', 'purple',
+    'orange', 'pink', 'white', 'black', 'gray'
+})
+_VALID_COLORS_JOINED = ', '.join(sorted(_VALID_COLORS))
+
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = dedent("""
         You are a helpful AI assistant with access to tools.
         You can check the current time in different timezones and change the background color.
         Be friendly and helpful in your responses.
     """)
+
+# Create the agent
+agent = Agent(
+    model=os.getenv('OPENAI_MODEL', 'openai:gpt-4o-mini'),
+    system_prompt=_SYSTEM_PROMPT
 )
 
 
@@ -37,13 +52,13 @@ async def get_current_time(timezone: Optional[str] = None) -> str:
     """
     try:
         if not timezone:
-            now = datetime.now(pytz.UTC)
+            now = datetime.now(_UTC)
             return f"Current time (UTC): {now.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-        
-        tz = pytz.timezone(timezone)
+
+        tz = ZoneInfo(timezone)
         now = datetime.now(tz)
         return f"Current time in {timezone}: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-    except pytz.UnknownTimeZoneError:
+    except ZoneInfoNotFoundError:
         return (
             f"Unknown timezone '{timezone}'. "
             f"Please use a valid IANA timezone like 'America/New_York', 'Europe/London', or 'Asia/Tokyo'."
@@ -63,13 +78,8 @@ async def set_background_color(color: str) -> str:
     Returns:
         Confirmation message.
     """
-    valid_colors = [
-        'red', 'blue', 'green', 'yellow', 'purple', 
-        'orange', 'pink', 'white', 'black', 'gray'
-    ]
-    
     # Check if it's a valid color name
-    if color.lower() in valid_colors:
+    if color.lower() in _VALID_COLORS:
         # This will be handled by the frontend via CopilotKit action
         return f"Background color changed to {color}! 🎨"
     
@@ -79,9 +89,14 @@ async def set_background_color(color: str) -> str:
     
     return (
         f"Invalid color '{color}'. "
-        f"Please use a color name ({', '.join(valid_colors)}) or a hex code (e.g., #FF5733)."
+        f"Please use a color name ({_VALID_COLORS_JOINED}) or a hex code (e.g., #FF5733)."
     )
 
 
-# Convert to AG-UI app
-app = agent.to_ag_ui()
\ No newline at end of file
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
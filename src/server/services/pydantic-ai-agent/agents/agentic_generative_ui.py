@@ -1,28 +1,20 @@
 """Agentic Generative UI feature using Pydantic AI with AG-UI protocol."""
 
-import os
 import asyncio
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 from .ag_ui_types import AgentDeps, StateDeps
-
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
-
-# Set OpenRouter API key for Pydantic AI
-os.environ['OPENROUTER_API_KEY'] = os.getenv('OPENROUTER_API_KEY', '')
+from ._model import shared_model, shared_model_settings
 
 # Define state model
 class TaskProgress(BaseModel):
     """Progress state for task execution."""
     steps: List[Dict[str, Any]] = Field(default_factory=list)
 
-# Create the agent with state support
-agent = Agent(
-    model='openrouter:openai/gpt-4o-mini',
-    system_prompt="""
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = """
     You are an AI assistant that shows real-time progress for complex operations.
     
     When the user asks you to do something complex:
@@ -37,7 +29,13 @@ agent = Agent(
     - Running complex calculations (prepare, compute, validate steps)
     
     Always show realistic progress updates and complete steps as you go.
-    """,
+    """
+
+# Create the agent with state support
+agent = Agent(
+    model=shared_model(),
+    model_settings=shared_model_settings(),
+    system_prompt=_SYSTEM_PROMPT,
     deps_type=StateDeps[TaskProgress]
 )
 
@@ -56,9 +54,12 @@ async def update_task_progress(
     """
     # Update the state
     await ctx.deps.state.set_state(TaskProgress(steps=steps))
-    
-    # Simulate some progress
-    completed_count = sum(1 for step in steps if step.get('status') == 'completed')
+
+    # Collapse the per-step dicts to a flat status byte string once, then
+    # count completions with a single C-level pass instead of a Python-level
+    # generator over dict lookups.
+    statuses = bytes(step.get('status') == 'completed' for step in steps)
+    completed_count = statuses.count(1)
     total_count = len(steps)
     
     if completed_count == total_count:
@@ -67,15 +68,11 @@ async def update_task_progress(
         return f"Progress: {completed_count}/{total_count} steps completed"
 
 
-# Convert to AG-UI app
-try:
-    app = agent.to_ag_ui()
-except Exception as e:
-    print(f"Error creating AG-UI app: {e}")
-    # Fallback: create a basic FastAPI app
-    from fastapi import FastAPI
-    app = FastAPI()
-    
-    @app.get("/")
-    async def health():
-        return {"status": "ok", "agent": "agentic_generative_ui"}
\ No newline at end of file
+
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
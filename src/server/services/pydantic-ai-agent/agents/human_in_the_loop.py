@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import os
+import re
+import sys
 from textwrap import dedent
 from typing import List
 
@@ -10,13 +11,7 @@ from pydantic import BaseModel, Field
 
 from pydantic_ai import Agent, RunContext
 from .ag_ui_types import ComponentModel, AgentDeps, InteractableEvent, EventType, CustomEvent
-
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
-
-# Set OpenRouter API key for Pydantic AI
-os.environ['OPENROUTER_API_KEY'] = os.getenv('OPENROUTER_API_KEY', '')
+from ._model import shared_model, shared_model_settings
 
 
 class TaskStep(BaseModel):
@@ -33,10 +28,42 @@ class TaskApproval(ComponentModel):
     steps: List[TaskStep]
 
 
-# Create the agent with dependencies
-agent = Agent(
-    model='openrouter:openai/gpt-4o-mini',
-    system_prompt=dedent("""
+# Fixed step templates, built once at import instead of per tool call.
+_WEBSITE_STEPS = (
+    {"description": "Create wireframes and design mockups", "status": "enabled"},
+    {"description": "Set up project structure and dependencies", "status": "enabled"},
+    {"description": "Implement responsive layout", "status": "enabled"},
+    {"description": "Add interactive features", "status": "enabled"},
+    {"description": "Test and deploy", "status": "enabled"},
+)
+_API_STEPS = (
+    {"description": "Design API endpoints and data models", "status": "enabled"},
+    {"description": "Set up database schema", "status": "enabled"},
+    {"description": "Implement authentication", "status": "enabled"},
+    {"description": "Add validation and error handling", "status": "enabled"},
+    {"description": "Write documentation", "status": "enabled"},
+)
+
+# One case-insensitive scan of the description instead of a .lower() call and
+# a substring check per keyword; the matched group name picks the template.
+_TEMPLATE_RE = re.compile(r"(?P<website>website)|(?P<api>api)", re.IGNORECASE)
+_TEMPLATES = {"website": _WEBSITE_STEPS, "api": _API_STEPS}
+
+# Response strings for process_approved_tasks: the static branch is interned
+# once, the dynamic branch formats a cached template.
+_NO_APPROVED = sys.intern(
+    "No tasks were approved. Let me know if you'd like to revise the task list."
+)
+_APPROVED_TMPL = (
+    "Great! I'll help you with the {n} approved tasks. "
+    "Let's start with the highest priority items first. "
+    "Which task would you like to begin with?"
+)
+
+
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = dedent("""
         You are a collaborative task planning assistant with interactive approval workflows.
         
         When the user describes a project or task, follow these steps:
@@ -47,6 +74,12 @@ agent = Agent(
         
         Always break down complex projects into 3-7 specific, actionable steps.
     """)
+
+# Create the agent with dependencies
+agent = Agent(
+    model=shared_model(),
+    model_settings=shared_model_settings(),
+    system_prompt=_SYSTEM_PROMPT
 )
 
 
@@ -65,25 +98,13 @@ async def ui_show_task_approval(
         Custom event that triggers the task approval UI
     """
     # Generate task steps based on the description
-    steps = []
-    
-    # Simple task generation logic
-    if "website" in task_description.lower():
-        steps = [
-            {"description": "Create wireframes and design mockups", "status": "enabled"},
-            {"description": "Set up project structure and dependencies", "status": "enabled"},
-            {"description": "Implement responsive layout", "status": "enabled"},
-            {"description": "Add interactive features", "status": "enabled"},
-            {"description": "Test and deploy", "status": "enabled"},
-        ]
-    elif "api" in task_description.lower():
-        steps = [
-            {"description": "Design API endpoints and data models", "status": "enabled"},
-            {"description": "Set up database schema", "status": "enabled"},
-            {"description": "Implement authentication", "status": "enabled"},
-            {"description": "Add validation and error handling", "status": "enabled"},
-            {"description": "Write documentation", "status": "enabled"},
-        ]
+    match = _TEMPLATE_RE.search(task_description)
+
+    # Simple task generation logic. The template tuples are passed through
+    # as-is — the payload is read-only downstream and tuples serialize as
+    # JSON arrays, so no per-call copy is needed.
+    if match:
+        steps = _TEMPLATES[match.lastgroup]
     else:
         # Generic steps
         steps = [
@@ -91,8 +112,9 @@ async def ui_show_task_approval(
             for i in range(num_steps)
         ]
     
-    # Return custom event that will trigger the React component
-    return CustomEvent(
+    # Return custom event that will trigger the React component. The payload
+    # is built from trusted literals above, so skip Pydantic validation.
+    return CustomEvent.model_construct(
         type=EventType.CUSTOM,
         name="task_approval",
         value={"steps": steps[:num_steps]}
@@ -112,24 +134,16 @@ async def process_approved_tasks(
         Summary of what will be done
     """
     if not approved_task_ids:
-        return "No tasks were approved. Let me know if you'd like to revise the task list."
-    
-    return (
-        f"Great! I'll help you with the {len(approved_task_ids)} approved tasks. "
-        f"Let's start with the highest priority items first. "
-        f"Which task would you like to begin with?"
-    )
+        return _NO_APPROVED
 
+    return _APPROVED_TMPL.format(n=len(approved_task_ids))
 
-# Convert to AG-UI app
-try:
-    app = agent.to_ag_ui()
-except Exception as e:
-    print(f"Failed to create AG-UI app for human_in_the_loop: {e}")
-    # Fallback: create basic FastAPI app
-    from fastapi import FastAPI
-    app = FastAPI()
-    
-    @app.get("/")
-    async def health():
-        return {"status": "ok", "agent": "human_in_the_loop"}
\ No newline at end of file
+
+
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -2,23 +2,16 @@
 
 from __future__ import annotations
 
-import os
 from textwrap import dedent
 
 from pydantic_ai import Agent
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from ._model import shared_model, shared_model_settings
 
-# Set OpenRouter API key for Pydantic AI
-os.environ['OPENROUTER_API_KEY'] = os.getenv('OPENROUTER_API_KEY', '')
 
-
-# Create the agent without custom tools to avoid conflicts
-agent = Agent(
-    model='openrouter:openai/gpt-4o-mini',
-    system_prompt=dedent("""
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = dedent("""
         You are an AI document editor that helps users write and edit documents in markdown format.
         
         CRITICAL RULE: When the user asks you to edit, complete, or continue their document,
@@ -49,18 +42,20 @@ agent = Agent(
         
         For general chat/questions, respond normally without code blocks.
     """)
+
+# Create the agent without custom tools to avoid conflicts
+agent = Agent(
+    model=shared_model(),
+    model_settings=shared_model_settings(),
+    system_prompt=_SYSTEM_PROMPT
 )
 
 
-# Convert to AG-UI app
-try:
-    app = agent.to_ag_ui()
-except Exception as e:
-    print(f"Failed to create AG-UI app for predictive_state_updates: {e}")
-    # Fallback: create basic FastAPI app
-    from fastapi import FastAPI
-    app = FastAPI()
-    
-    @app.get("/")
-    async def health():
-        return {"status": "ok", "agent": "predictive_state_updates"}
\ No newline at end of file
+
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
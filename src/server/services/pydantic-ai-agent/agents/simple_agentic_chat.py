@@ -1,27 +1,43 @@
 """Simple Agentic Chat - working version for current pydantic-ai."""
 
-import os
-from datetime import datetime
+from datetime import datetime, timezone as _timezone
+from functools import lru_cache
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from pydantic_ai import Agent
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
+from ._model import shared_model, shared_model_settings
 
-# Set OpenRouter API key for Pydantic AI
-os.environ['OPENROUTER_API_KEY'] = os.getenv('OPENROUTER_API_KEY', '')
+# The tool parameter below shadows the `timezone` name, hence the alias.
+_UTC = _timezone.utc
 
-# Create a simple agent
-agent = Agent(
-    model='openrouter:openai/gpt-4o-mini',
-    system_prompt="""
+# Suggestions for the unknown-timezone error, joined once at import.
+_SUGGESTED_TIMEZONES = ', '.join((
+    'America/New_York', 'Europe/London', 'Asia/Tokyo',
+    'Australia/Sydney', 'America/Los_Angeles',
+))
+
+
+@lru_cache(maxsize=128)
+def _get_tz(name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo so repeated zones skip the tzdata load."""
+    return ZoneInfo(name)
+
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = """
     You are a helpful AI assistant with access to tools.
     You can check the current time in different timezones using get_time_in_timezone.
     You can also change the background color - just ask and the system will handle it.
     Be friendly and helpful in your responses.
     """
+
+# Create a simple agent
+agent = Agent(
+    model=shared_model(),
+    model_settings=shared_model_settings(),
+    system_prompt=_SYSTEM_PROMPT
 )
 
 @agent.tool_plain
@@ -36,27 +52,23 @@ async def get_time_in_timezone(timezone: Optional[str] = None) -> str:
         A string with the current time and timezone.
     """
     if not timezone:
-        return f"Current time (UTC): {datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S %Z')}"
-    
+        now = datetime.now(_UTC)
+        return f"Current time (UTC): {now:%Y-%m-%d %H:%M:%S} {now.tzname()}"
+
     try:
-        tz = pytz.timezone(timezone)
+        tz = _get_tz(timezone)
         now = datetime.now(tz)
-        return f"Current time in {timezone}: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}"
-    except pytz.exceptions.UnknownTimeZoneError:
-        available_timezones = ['America/New_York', 'Europe/London', 'Asia/Tokyo', 'Australia/Sydney', 'America/Los_Angeles']
-        return f"Unknown timezone '{timezone}'. Try one of these: {', '.join(available_timezones)}"
+        return f"Current time in {timezone}: {now:%Y-%m-%d %H:%M:%S} {now.tzname()}"
+    except (ZoneInfoNotFoundError, ValueError):
+        return f"Unknown timezone '{timezone}'. Try one of these: {_SUGGESTED_TIMEZONES}"
 
 # Background color functionality is handled by CopilotKit frontend action
 
-# Convert to AG-UI app
-try:
-    app = agent.to_ag_ui()
-except Exception as e:
-    print(f"Error creating AG-UI app: {e}")
-    # Fallback: create a basic FastAPI app
-    from fastapi import FastAPI
-    app = FastAPI()
-    
-    @app.get("/")
-    async def health():
-        return {"status": "ok", "agent": "simple_agentic_chat"}
\ No newline at end of file
+
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,25 +1,154 @@
 """Tool Based Generative UI agent - creates haikus, recipes, and code snippets."""
 
-import os
+import asyncio
 import random
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Optional
 from pydantic_ai import Agent
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
-
-# Set OpenRouter API key for Pydantic AI
-os.environ['OPENROUTER_API_KEY'] = os.getenv('OPENROUTER_API_KEY', '')
+from ._model import shared_model, shared_model_settings
 
 # Data models are now handled by the frontend React components
 # Tools return simple strings and the frontend handles the rich UI display
 
-# Create the agent
-agent = Agent(
-    model='openrouter:openai/gpt-4o-mini',
-    system_prompt="""
+# Exact-match cache for the tool results below. The tools are pure functions
+# of their resolved arguments, so a repeat call (same theme/cuisine/language)
+# collapses to a dict lookup instead of rebuilding the payload. The payloads
+# are read-only downstream, so cached dicts are returned without copying.
+# Keys include LLM-authored free text (theme, purpose), so the cache is
+# bounded: hits are refreshed to the back and the oldest entry is evicted
+# once the cap is reached, keeping memory flat over a long-running process.
+_TOOL_CACHE: dict = {}
+_TOOL_CACHE_MAX = 128
+
+
+def _cache_get(key):
+    """Return the cached payload for key, refreshing its LRU position."""
+    value = _TOOL_CACHE.pop(key, None)
+    if value is not None:
+        _TOOL_CACHE[key] = value
+    return value
+
+
+def _cache_put(key, value):
+    """Store a payload, evicting the least recently used entry when full."""
+    if len(_TOOL_CACHE) >= _TOOL_CACHE_MAX:
+        del _TOOL_CACHE[next(iter(_TOOL_CACHE))]
+    _TOOL_CACHE[key] = value
+
+# Canned content tables, built once at import instead of per tool call.
+_HAIKUS = {
+    'nature': {
+        'title': 'Nature\'s Whisper',
+        'lines': [
+            'Morning dew glistens',
+            'On petals soft as silk dreams',
+            'Spring awakens earth'
+        ]
+    },
+    'technology': {
+        'title': 'Digital Dreams',
+        'lines': [
+            'Code flows like water',
+            'Binary thoughts crystallize',
+            'Silicon wisdom'
+        ]
+    },
+    'love': {
+        'title': 'Heart\'s Echo',
+        'lines': [
+            'Two hearts beat as one',
+            'In rhythm with the cosmos',
+            'Love transcends all time'
+        ]
+    }
+}
+
+_RECIPES = {
+    'italian': {
+        'name': 'Classic Pasta Marinara',
+        'ingredients': [
+            '2 cups penne pasta',
+            '1 cup marinara sauce',
+            '1/2 cup parmesan cheese',
+            'Fresh basil leaves',
+            '2 tbsp olive oil',
+            '2 cloves garlic'
+        ],
+        'steps': [
+            'Boil salted water and cook pasta al dente',
+            'Heat olive oil and sauté minced garlic',
+            'Add marinara sauce and simmer',
+            'Toss pasta with sauce',
+            'Top with parmesan and fresh basil'
+        ],
+        'prep_time': '20 minutes',
+        'servings': 4
+    },
+    'japanese': {
+        'name': 'Simple Chicken Teriyaki',
+        'ingredients': [
+            '2 chicken breasts',
+            '1/4 cup soy sauce',
+            '2 tbsp mirin',
+            '1 tbsp sugar',
+            '1 tsp sesame oil',
+            'Green onions for garnish'
+        ],
+        'steps': [
+            'Cut chicken into bite-sized pieces',
+            'Mix soy sauce, mirin, and sugar for sauce',
+            'Cook chicken in sesame oil until golden',
+            'Add sauce and simmer until glazed',
+            'Garnish with chopped green onions'
+        ],
+        'prep_time': '15 minutes',
+        'servings': 2
+    }
+}
+
+# Final wire payloads for the known themes, stamped once at import so a
+# known-theme call does no per-call dict construction at all.
+_HAIKU_PAYLOADS = {t: {**h, 'theme': t} for t, h in _HAIKUS.items()}
+
+# Code-snippet templates, keyed by (language, kind) and formatted with the
+# caller's purpose at call time. The brace escaping is paid once here
+# instead of on every invocation.
+_SNIPPET_TEMPLATES = {
+    ('python', 'hello'): (
+        '# {purpose}\ndef greet(name="World"):\n    return f"Hello, {{name}}!"\n\nprint(greet())',
+        'Python Hello World - {purpose}',
+        'A simple Python function that greets users with customizable names.'
+    ),
+    ('python', 'default'): (
+        '# {purpose}\ndef example_function():\n    """{purpose}"""\n    result = "This demonstrates {purpose}"\n    return result\n\nprint(example_function())',
+        'Python Function - {purpose}',
+        'A Python function demonstrating {purpose} with proper documentation and return value.'
+    ),
+    ('javascript', 'hello'): (
+        '// {purpose}\nfunction greet(name = "World") {{\n    return `Hello, ${{name}}!`;\n}}\n\nconsole.log(greet());',
+        'JavaScript Hello World - {purpose}',
+        'A JavaScript function using template literals for dynamic greetings.'
+    ),
+    ('javascript', 'default'): (
+        '// {purpose}\nfunction exampleFunction() {{\n    // {purpose}\n    const result = "This demonstrates {purpose}";\n    return result;\n}}\n\nconsole.log(exampleFunction());',
+        'JavaScript Function - {purpose}',
+        'A JavaScript function demonstrating {purpose} with modern ES6 syntax.'
+    ),
+}
+
+# Language aliases folded into their canonical template key.
+_LANG_ALIAS = {'js': 'javascript'}
+
+# Fallback for languages without a canned template.
+_GENERIC_SNIPPET = (
+    "// {purpose} in {language}\nfunction example() {{\n    return 'Example for {purpose}';\n}}",
+    '{language} Example - {purpose}',
+    'A basic {language} function template for {purpose}.'
+)
+
+# Static system prompt, built once at import so every request reuses the
+# same string object (and providers see a byte-identical cacheable prefix).
+_SYSTEM_PROMPT = """
     You are a creative AI assistant that generates beautiful content including haikus, recipes, and code snippets.
     
     When users ask you to create content, follow these steps:
@@ -36,6 +165,12 @@ agent = Agent(
     Always call the UI display tool after generating content to show it in the rich UI format.
     Be artistic and thoughtful in your creations.
     """
+
+# Create the agent
+agent = Agent(
+    model=shared_model(),
+    model_settings=shared_model_settings(),
+    system_prompt=_SYSTEM_PROMPT
 )
 
 @agent.tool_plain
@@ -51,48 +186,27 @@ async def create_haiku(theme: Optional[str] = None) -> dict:
     themes = ['nature', 'technology', 'seasons', 'love', 'wisdom', 'time']
     if not theme:
         theme = random.choice(themes)
-    
-    # Generate different haikus based on theme
-    haiku_variations = {
-        'nature': {
-            'title': 'Nature\'s Whisper',
-            'lines': [
-                'Morning dew glistens',
-                'On petals soft as silk dreams',
-                'Spring awakens earth'
-            ]
-        },
-        'technology': {
-            'title': 'Digital Dreams',
-            'lines': [
-                'Code flows like water',
-                'Binary thoughts crystallize',
-                'Silicon wisdom'
-            ]
-        },
-        'love': {
-            'title': 'Heart\'s Echo',
+
+    # Cache on the resolved theme so a missing theme stays random per call.
+    cached = _cache_get(('create_haiku', theme))
+    if cached is not None:
+        return cached
+
+    # Use the pre-stamped payload for known themes, or build one ad hoc.
+    haiku_data = _HAIKU_PAYLOADS.get(theme)
+    if haiku_data is None:
+        haiku_data = {
+            'title': f'Thoughts on {theme.title()}',
             'lines': [
-                'Two hearts beat as one',
-                'In rhythm with the cosmos',
-                'Love transcends all time'
-            ]
+                'Moments drift like clouds',
+                'Each breath a small infinity',
+                'Life unfolds in verse'
+            ],
+            'theme': theme
         }
-    }
-    
-    # Use theme-specific haiku or default
-    haiku_data = haiku_variations.get(theme, {
-        'title': f'Thoughts on {theme.title()}',
-        'lines': [
-            'Moments drift like clouds',
-            'Each breath a small infinity',
-            'Life unfolds in verse'
-        ]
-    })
-    
-    haiku_data['theme'] = theme
-    
+
     # Return the haiku data - CopilotKit will render this using the matching frontend action
+    _cache_put(('create_haiku', theme), haiku_data)
     return haiku_data
 
 @agent.tool_plain
@@ -108,54 +222,15 @@ async def create_recipe(cuisine: Optional[str] = None, dietary: Optional[str] =
     """
     cuisine = cuisine or "Italian"
     dietary = dietary or "regular"
-    
-    # Generate different recipes based on cuisine
-    recipe_variations = {
-        'italian': {
-            'name': 'Classic Pasta Marinara',
-            'ingredients': [
-                '2 cups penne pasta',
-                '1 cup marinara sauce',
-                '1/2 cup parmesan cheese',
-                'Fresh basil leaves',
-                '2 tbsp olive oil',
-                '2 cloves garlic'
-            ],
-            'steps': [
-                'Boil salted water and cook pasta al dente',
-                'Heat olive oil and sauté minced garlic',
-                'Add marinara sauce and simmer',
-                'Toss pasta with sauce',
-                'Top with parmesan and fresh basil'
-            ],
-            'prep_time': '20 minutes',
-            'servings': 4
-        },
-        'japanese': {
-            'name': 'Simple Chicken Teriyaki',
-            'ingredients': [
-                '2 chicken breasts',
-                '1/4 cup soy sauce',
-                '2 tbsp mirin',
-                '1 tbsp sugar',
-                '1 tsp sesame oil',
-                'Green onions for garnish'
-            ],
-            'steps': [
-                'Cut chicken into bite-sized pieces',
-                'Mix soy sauce, mirin, and sugar for sauce',
-                'Cook chicken in sesame oil until golden',
-                'Add sauce and simmer until glazed',
-                'Garnish with chopped green onions'
-            ],
-            'prep_time': '15 minutes',
-            'servings': 2
-        }
-    }
-    
+
+    cached = _cache_get(('create_recipe', cuisine, dietary))
+    if cached is not None:
+        return cached
+
     # Use cuisine-specific recipe or default to Italian
-    recipe_data = recipe_variations.get(cuisine.lower(), recipe_variations['italian'])
-    
+    recipe_data = _RECIPES.get(cuisine.lower(), _RECIPES['italian'])
+
+    _cache_put(('create_recipe', cuisine, dietary), recipe_data)
     return recipe_data
 
 @agent.tool_plain
@@ -169,50 +244,51 @@ async def create_code_snippet(language: str, purpose: str) -> dict:
     Returns:
         CodeSnippet object with language, code, explanation, and title
     """
-    # Generate different code snippets based on language and purpose
-    if language.lower() == 'python':
-        if 'hello' in purpose.lower():
-            code = f'# {purpose}\ndef greet(name="World"):\n    return f"Hello, {{name}}!"\n\nprint(greet())'
-            title = f"Python Hello World - {purpose}"
-            explanation = "A simple Python function that greets users with customizable names."
-        else:
-            code = f'# {purpose}\ndef example_function():\n    """{purpose}"""\n    result = "This demonstrates {purpose}"\n    return result\n\nprint(example_function())'
-            title = f"Python Function - {purpose}"
-            explanation = f"A Python function demonstrating {purpose} with proper documentation and return value."
-    elif language.lower() in ['javascript', 'js']:
-        if 'hello' in purpose.lower():
-            code = f'// {purpose}\nfunction greet(name = "World") {{\n    return `Hello, ${{name}}!`;\n}}\n\nconsole.log(greet());'
-            title = f"JavaScript Hello World - {purpose}"
-            explanation = "A JavaScript function using template literals for dynamic greetings."
-        else:
-            code = f'// {purpose}\nfunction exampleFunction() {{\n    // {purpose}\n    const result = "This demonstrates {purpose}";\n    return result;\n}}\n\nconsole.log(exampleFunction());'
-            title = f"JavaScript Function - {purpose}"
-            explanation = f"A JavaScript function demonstrating {purpose} with modern ES6 syntax."
-    else:
-        code = f"// {purpose} in {language}\nfunction example() {{\n    return 'Example for {purpose}';\n}}"
-        title = f"{language} Example - {purpose}"
-        explanation = f"A basic {language} function template for {purpose}."
-    
-    return {
+    cached = _cache_get(('create_code_snippet', language, purpose))
+    if cached is not None:
+        return cached
+
+    # Dispatch on (language, kind) instead of branching per language.
+    lang = language.lower()
+    lang = _LANG_ALIAS.get(lang, lang)
+    kind = 'hello' if 'hello' in purpose.lower() else 'default'
+
+    templates = _SNIPPET_TEMPLATES.get((lang, kind), _GENERIC_SNIPPET)
+    code_tpl, title_tpl, explanation_tpl = templates
+    code = code_tpl.format(purpose=purpose, language=language)
+    title = title_tpl.format(purpose=purpose, language=language)
+    explanation = explanation_tpl.format(purpose=purpose, language=language)
+
+
+    snippet_data = {
         "language": language,
         "code": code,
         "explanation": explanation,
         "title": title
     }
+    _cache_put(('create_code_snippet', language, purpose), snippet_data)
+    return snippet_data
 
 # Note: The frontend CopilotKit actions with matching names (create_haiku, create_recipe, create_code_snippet)
 # will automatically render the data returned by these tools using their render functions.
 # This follows the AG-UI protocol pattern where tool calls directly trigger UI rendering.
 
-# Convert to AG-UI app
-try:
-    app = agent.to_ag_ui()
-except Exception as e:
-    print(f"Error creating AG-UI app: {e}")
-    # Fallback: create a basic FastAPI app
-    from fastapi import FastAPI
-    app = FastAPI()
-    
-    @app.get("/")
-    async def health():
-        return {"status": "ok", "agent": "tool_based_generative_ui"}
\ No newline at end of file
+
+async def run_batch_async(prompts: list[str], **kwargs):
+    """Run the agent over many prompts concurrently.
+
+    For offline workflows (seeding a gallery, evaluation sweeps) the AG-UI
+    endpoint forces one request per prompt through the full agent loop.
+    This dispatches all runs at once and returns their results in prompt
+    order; failures propagate like a single agent.run() would.
+    """
+    return await asyncio.gather(*(agent.run(p, **kwargs) for p in prompts))
+
+
+def __getattr__(name):
+    """Build the AG-UI app lazily on first access (PEP 562)."""
+    if name == "app":
+        global app
+        app = agent.to_ag_ui()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
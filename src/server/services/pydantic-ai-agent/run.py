@@ -5,17 +5,28 @@ import sys
 import os
 from pathlib import Path
 
-# Load environment variables from project root
-from dotenv import load_dotenv
-project_root = Path(__file__).parent.parent.parent.parent.parent
-env_path = project_root / '.env'
-load_dotenv(env_path)
+if __name__ == "__main__":
+    # Load environment variables from project root. Done under the main
+    # guard so importing this module doesn't walk the filesystem or parse
+    # .env — the server loads env itself on startup via agents._env.
+    from dotenv import load_dotenv
+    project_root = Path(__file__).parent.parent.parent.parent.parent
+    env_path = project_root / '.env'
+    load_dotenv(env_path)
 
-# Add the current directory to the Python path for imports
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+    # Add the current directory to the Python path for imports
+    current_dir = Path(__file__).parent
+    sys.path.insert(0, str(current_dir))
 
-if __name__ == "__main__":
     import uvicorn
-    # Use module path instead of direct import to avoid relative import issues
-    uvicorn.run("__init__:app", host="0.0.0.0", port=9000, reload=True)
\ No newline at end of file
+    # Use module path instead of direct import to avoid relative import issues.
+    # DEV=1 enables the autoreload file watcher (single process only);
+    # otherwise WORKERS processes serve in parallel (default: CPU count).
+    dev = os.getenv("DEV") == "1"
+    uvicorn.run(
+        "__init__:app",
+        host="0.0.0.0",
+        port=9000,
+        reload=dev,
+        workers=1 if dev else int(os.getenv("WORKERS", os.cpu_count() or 1)),
+    )
\ No newline at end of file